@@ -22,7 +22,7 @@ conda env update -q -f etc/environment-py39.yml
 # Pip install packages
 python -m pip install --progress-bar off -U pip
 pip install --progress-bar off -U -r requirements.txt
-pip install --progress-bar off -U pytest pytest-cov pylint pytest-lazy-fixture
+pip install --progress-bar off -U pytest pytest-cov pylint
 
 # Conda list
 conda list
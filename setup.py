@@ -0,0 +1,28 @@
+"""
+Optional compiled build. Package metadata is defined in pyproject.toml.
+
+Set TYPEDPARSER_CYTHON=1 to compile the pure python glue modules with Cython. Cython is not part
+of the build requirements, so install it first and disable build isolation:
+
+    pip install cython
+    TYPEDPARSER_CYTHON=1 pip install --no-build-isolation .
+
+Without the variable, or if Cython cannot be imported, the regular pure python package is built.
+"""
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("TYPEDPARSER_CYTHON", "0") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("TYPEDPARSER_CYTHON=1 but Cython is not installed, building pure python package.")
+    else:
+        ext_modules = cythonize(
+            ["src/typedparser/funcs.py", "src/typedparser/objects.py"],
+            compiler_directives={"language_level": "3", "boundscheck": False,
+                                 "wraparound": False, "nonecheck": False, "cdivision": True})
+
+setup(ext_modules=ext_modules)
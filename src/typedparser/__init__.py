@@ -1,8 +1,43 @@
-from ._typedattr import definenumpy, attrs_from_dict
-from ._typedparser import add_argument, TypedParser, define, VerboseQuietArgs
-from .custom_format import CustomArgparseFmt
-from .objects import get_attr_names
+"""
+Symbols are loaded lazily on first access (PEP 562) to keep the import of the package cheap.
+"""
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._typedattr import definenumpy, attrs_from_dict
+    from ._typedparser import add_argument, TypedParser, define, VerboseQuietArgs
+    from .custom_format import CustomArgparseFmt
+    from .objects import get_attr_names
+
+_LAZY = {
+    "definenumpy": "._typedattr",
+    "attrs_from_dict": "._typedattr",
+    "add_argument": "._typedparser",
+    "TypedParser": "._typedparser",
+    "define": "._typedparser",
+    "VerboseQuietArgs": "._typedparser",
+    "CustomArgparseFmt": ".custom_format",
+    "get_attr_names": ".objects",
+}
 
 __all__ = ["definenumpy", "attrs_from_dict", "get_attr_names",
            "add_argument", "TypedParser", "define", "VerboseQuietArgs", "CustomArgparseFmt"]
 __version__ = "0.2.11"
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+    elif find_spec(f"{__name__}.{name}") is not None:
+        # submodules that were not imported yet e.g. typedparser.funcs
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
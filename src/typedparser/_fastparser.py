@@ -0,0 +1,175 @@
+"""
+Code generation of a specialized argument parser for simple argparse parsers.
+
+The generated function only handles the common case: known option strings given as separate
+tokens, values that do not start with "-" (except "-" itself) and a single run of positional
+arguments. For anything else it returns None and the caller falls back to the full argparse parser, which then also
+produces the correct error messages.
+
+Since argparse parses the arguments again after a fallback, type functions can be called twice.
+Parsers with argparse.FileType arguments, which open files, are not supported for this reason.
+"""
+import argparse
+from typing import Callable, Dict, List, Optional
+
+# pylint: disable=protected-access
+_CONST_ACTIONS = (argparse._StoreTrueAction, argparse._StoreFalseAction,
+                  argparse._StoreConstAction)
+_SUPPORTED_ACTIONS = (argparse._StoreAction, argparse._CountAction, argparse._AppendAction,
+                      argparse._AppendConstAction, argparse._HelpAction) + _CONST_ACTIONS
+
+FastParseFn = Callable[[List[str]], Optional[Dict[str, object]]]
+
+
+def _copy_items(items):
+    # argparse._copy_items for the None or list defaults allowed by compile_fast_parser.
+    # argparse._copy_items is not available in all python versions
+    if items is None:
+        return []
+    return items[:]
+
+
+def compile_fast_parser(parser: argparse.ArgumentParser) -> Optional[FastParseFn]:
+    """
+    Generate a function that parses a list of argument strings into a dict of dest to value,
+    in the same way as the given argparse parser.
+
+    Args:
+        parser: the argparser
+
+    Returns:
+        Function that returns None if the arguments need to be parsed by argparse,
+        or None if the parser uses features that are not supported.
+    """
+    if (parser.prefix_chars != "-" or parser.fromfile_prefix_chars is not None
+            or parser._defaults or parser._mutually_exclusive_groups):
+        return None
+
+    actions = [action for action in parser._actions
+               if not isinstance(action, argparse._HelpAction)]
+    dests = [action.dest for action in actions]
+    if len(set(dests)) != len(dests):
+        return None
+
+    env = {"_copy_items": _copy_items}
+    lines_default, lines_dispatch, lines_final = [], [], []
+    positionals = []
+    for i, action in enumerate(actions):
+        if (type(action) not in _SUPPORTED_ACTIONS
+                or action.choices is not None or action.default is argparse.SUPPRESS
+                or action.dest is argparse.SUPPRESS
+                or not (action.type is None or callable(action.type))
+                or isinstance(action.type, argparse.FileType)):
+            return None
+        if (isinstance(action, (argparse._AppendAction, argparse._AppendConstAction))
+                and not (action.default is None or isinstance(action.default, list))):
+            # argparse copies other defaults and fails to append to e.g. a tuple
+            return None
+        dest, default, const, type_fn = f"_dest{i}", f"_default{i}", f"_const{i}", f"_type{i}"
+        env.update({dest: action.dest, default: action.default, const: action.const,
+                    type_fn: action.type if action.type is not None else str})
+        lines_default.append(f"out[{dest}] = {default}")
+
+        if not action.option_strings:
+            if not isinstance(action, argparse._StoreAction) or action.nargs not in (None, "+"):
+                return None
+            if positionals and positionals[-1][1] == "+":
+                # only the last positional can be variadic
+                return None
+            positionals.append((dest, action.nargs, type_fn))
+            continue
+
+        if action.type is not None and isinstance(action.default, str):
+            # argparse converts string defaults of optional arguments that were not given
+            lines_final.append(f"if out[{dest}] is {default}:")
+            lines_final.append(f"    out[{dest}] = {type_fn}({default})")
+        condition = " or ".join(f"a == {option!r}" for option in action.option_strings)
+        lines_dispatch.append(f"elif {condition}:")
+        body = []
+        if action.required:
+            seen = f"_seen{i}"
+            lines_default.append(f"{seen} = False")
+            lines_final.append(f"if not {seen}:")
+            lines_final.append("    return None")
+            body.append(f"{seen} = True")
+        if isinstance(action, _CONST_ACTIONS):
+            body.append(f"out[{dest}] = {const}")
+        elif isinstance(action, argparse._CountAction):
+            body.append(f"out[{dest}] = (out[{dest}] or 0) + 1")
+        elif isinstance(action, argparse._AppendConstAction):
+            body.append(f"out[{dest}] = _copy_items(out[{dest}]) + [{const}]")
+        elif action.nargs is None:
+            body += ["if i + 1 >= n or (argv[i + 1][:1] == '-' and argv[i + 1] != '-'):",
+                     "    return None",
+                     "i += 1"]
+            if isinstance(action, argparse._AppendAction):
+                body.append(f"out[{dest}] = _copy_items(out[{dest}]) + [{type_fn}(argv[i])]")
+            else:
+                body.append(f"out[{dest}] = {type_fn}(argv[i])")
+        elif action.nargs in ("+", "*") and isinstance(action, argparse._StoreAction):
+            body += ["j = i + 1",
+                     "while j < n and (argv[j][:1] != '-' or argv[j] == '-'):",
+                     "    j += 1"]
+            if action.nargs == "+":
+                body += ["if j == i + 1:",
+                         "    return None"]
+            body += [f"out[{dest}] = [{type_fn}(v) for v in argv[i + 1:j]]",
+                     "i = j - 1"]
+        else:
+            return None
+        lines_dispatch += [f"    {line}" for line in body]
+
+    # positional arguments must be given as a single run of values
+    num_single = len([p for p in positionals if p[1] is None])
+    is_variadic = len(positionals) > num_single
+    lines_positionals = [
+        f"if len(pos) {'<' if is_variadic else '!='} {num_single + int(is_variadic)}:",
+        "    return None"]
+    for j, (dest, nargs, type_fn) in enumerate(positionals):
+        if nargs is None:
+            lines_positionals.append(f"out[{dest}] = {type_fn}(pos[{j}])")
+        else:
+            lines_positionals.append(f"out[{dest}] = [{type_fn}(v) for v in pos[{j}:]]")
+
+    lines = [
+        "def fast_parse(argv):",
+        "    out = {}",
+        *[f"    {line}" for line in lines_default],
+        "    pos = []",
+        "    pos_state = 0  # 0: no positionals yet, 1: in positional run, 2: run finished",
+        "    n = len(argv)",
+        "    i = 0",
+        "    while i < n:",
+        "        a = argv[i]",
+        "        if a[:1] != '-' or a == '-':",
+        "            if pos_state == 2:",
+        "                return None",
+        "            pos_state = 1",
+        "            pos.append(a)",
+        "            i += 1",
+        "            continue",
+        "        if pos_state == 1:",
+        "            pos_state = 2",
+        "        if False:",
+        "            pass",
+        *[f"        {line}" for line in lines_dispatch],
+        "        else:",
+        "            return None",
+        "        i += 1",
+        *[f"    {line}" for line in lines_positionals],
+        *[f"    {line}" for line in lines_final],
+        "    return out",
+    ]
+    source = "\n".join(lines)
+    code = compile(source, f"<typedparser fast parser {parser.prog}>", "exec")
+    exec(code, env)  # pylint: disable=exec-used
+    fast_parse = env["fast_parse"]
+
+    def fast_parse_safe(argv: List[str]) -> Optional[Dict[str, object]]:
+        try:
+            return fast_parse(argv)
+        except Exception:  # pylint: disable=broad-except
+            # e.g. type conversion failed, let argparse create the error
+            return None
+
+    return fast_parse_safe
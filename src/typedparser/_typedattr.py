@@ -3,9 +3,9 @@ from functools import partial
 from inspect import isclass
 from pathlib import Path
 from typing import (
-    Tuple, Union, Dict, AbstractSet, Iterable, Mapping, Collection, Type, Any, List, Optional)
+    Tuple, Union, Dict, AbstractSet, Iterable, Mapping, Collection, Type, Any, List, Optional,
+    Callable)
 
-import attrs
 from attr import has, AttrsInstance
 from attrs import define, fields_dict, fields, Attribute
 
@@ -18,6 +18,8 @@ except ImportError:
     # python<3.8
     from typing_extensions import get_origin, get_args
 
+NoneType = type(None)
+
 # default conversions allow to convert instead of raising errors in case of matching types
 # e.g. create Path given str, or create float given int
 conversion_type = List[Tuple[Tuple[Type, ...], Type]]
@@ -114,25 +116,12 @@ def _attrs_from_dict(
         else:
             nonmatching_input[key] = value
 
-    # split into positional and keyword arguments
-    in_args, in_kwargs = [], {}
-    cls_fields_dict = fields_dict(cls)
-    for field_name, field_value in matching_input.items():
-        field_att = cls_fields_dict[field_name]
-        try:
-            is_positional = bool(field_att.default == attrs.NOTHING)
-        except ValueError:
-            # some field defaults, e.g. numpy arrays do not have comparison defined here
-            # but that means that the default is set and the field is not positional
-            is_positional = False
-        if is_positional:
-            in_args.append(field_value)
-        else:
-            in_kwargs[field_name] = field_value
-
-    # create an attrs instance from the dict
+    # create an attrs instance from the dict with a single call to the generated __init__
     # the instance will be flat (nested dicts are not resolved yet) and not typechecked.
-    attrs_inst = attrs.evolve(cls(*in_args), **in_kwargs)  # noqa
+    cls_fields_dict = fields_dict(cls)
+    init_kwargs = {get_init_name(cls_fields_dict[field_name]): field_value
+                   for field_name, field_value in matching_input.items()}
+    attrs_inst = cls(**init_kwargs)
 
     # typecheck and unfold nested values in the attrs instance
     for att in all_atts:
@@ -141,7 +130,8 @@ def _attrs_from_dict(
         typ = att.type
         new_value = _parse_nested(recursor, name, value, typ, strict=strict,
                                   skip_unknowns=skip_unknowns, conversions=conversions)
-        setattr(attrs_inst, name, new_value)
+        if new_value is not value:
+            setattr(attrs_inst, name, new_value)
 
     # handle unknown fields
     if len(nonmatching_input) > 0 and not skip_unknowns:
@@ -164,14 +154,118 @@ def _attrs_from_dict(
     return attrs_inst
 
 
+def get_init_name(att: Attribute) -> str:
+    # attrs strips leading underscores of private attributes for the __init__ argument name
+    alias = getattr(att, "alias", None)  # attrs>=22.2
+    return att.name.lstrip("_") if alias is None else alias
+
+
+def is_passthrough_type(typ) -> bool:
+    """
+    Check whether non-strict parsing with the default conversions always returns values
+    of this type annotation unchanged, i.e. there is nothing to convert or resolve.
+    """
+    if typ is None or typ == Any:
+        return True
+    origin, args = _get_origin_and_args(typ)
+    if origin == Union:
+        return all(is_passthrough_type(arg) for arg in args)
+    if origin is not None or not isclass(typ) or has(typ):
+        return False
+    return not any(issubclass(typ, target) for _, target in default_conversions)
+
+
+ValueCheck = Callable[[Any], bool]
+
+
+def get_strict_validator(typ, maybe_none: bool = True) -> Optional[ValueCheck]:
+    """
+    Create a function that returns True if strict parsing with the default conversions returns
+    the value unchanged. False means the value must be parsed with attrs_from_dict, which will
+    either convert it or raise an error.
+
+    Args:
+        typ: type annotation
+        maybe_none: if False, the value is not expected to be None and the None check of
+            Optional annotations is skipped. A None value then fails the check.
+
+    Returns:
+        The function, or None if the type annotation is not supported.
+    """
+    checks = _get_checks(typ, maybe_none=maybe_none)
+    return None if checks is None else checks[0]
+
+
+def _get_checks(typ, maybe_none: bool = True) -> Optional[Tuple[ValueCheck, ValueCheck]]:
+    # returns check whether the value is unchanged, and check whether parsing may succeed
+    if typ == Any:
+        return lambda v: True, lambda v: True
+    origin, args = _get_origin_and_args(typ)
+
+    if origin == Union:
+        if not maybe_none:
+            args = tuple(arg for arg in args if arg is not NoneType)
+            if len(args) == 1:
+                return _get_checks(args[0])
+        all_checks = [_get_checks(arg) for arg in args]
+        if any(checks is None for checks in all_checks):
+            return None
+
+        def check_union(v):
+            # same as parsing: the first type in the union that works is used
+            for check, may_succeed in all_checks:
+                if check(v):
+                    return True
+                if may_succeed(v):
+                    return False
+            return False
+
+        return check_union, lambda v: any(may_succeed(v) for _, may_succeed in all_checks)
+
+    if origin == list:
+        if len(args) == 0:
+            # bare typing.List is not supported by _parse_nested
+            return None
+        item_checks = _get_checks(args[0])
+        if item_checks is None:
+            return None
+        check_item = item_checks[0]
+        return (lambda v: isinstance(v, list) and all(check_item(x) for x in v),
+                lambda v: isinstance(v, (list, tuple, set, frozenset)))
+
+    if origin is not None or not isclass(typ) or has(typ):
+        return None
+    sources = tuple(source_type for source_types, target in default_conversions
+                    if issubclass(typ, target) for source_type in source_types)
+    if len(sources) == 0:
+        return lambda v: isinstance(v, typ), lambda v: isinstance(v, typ)
+    return lambda v: isinstance(v, typ), lambda v: isinstance(v, (typ,) + sources)
+
+
+# cache of resolved type annotations by identity. cannot use lru_cache here since e.g.
+# Union[int, float] == Union[float, int] but the order matters when parsing
+_origin_and_args_cache: Dict[int, Tuple[Any, Any, Tuple[Any, ...]]] = {}
+
+
+def _get_origin_and_args(typ) -> Tuple[Any, Tuple[Any, ...]]:
+    # resolving the annotation is the same for every value, cache it per type
+    entry = _origin_and_args_cache.get(id(typ))
+    if entry is not None and entry[0] is typ:
+        return entry[1], entry[2]
+    origin, args = get_origin(typ), get_args(typ)
+    if len(_origin_and_args_cache) < 1024:
+        # keep a reference to the type so the id cannot be reused
+        _origin_and_args_cache[id(typ)] = (typ, origin, args)
+    return origin, args
+
+
 def _parse_nested(recursor: RecursorInterface, name, value, typ,
                   strict: bool = True, skip_unknowns: bool = False,
                   conversions: conversion_type = None, depth: int = 0):
     conversions = default_conversions if conversions is None else conversions
     parse_recursive = partial(_parse_nested, recursor, depth=depth + 1, skip_unknowns=skip_unknowns)
 
-    origin = get_origin(typ)
-    args = get_args(typ)
+    origin, args = _get_origin_and_args(typ)
 
     target_type_name = typ.__name__ if hasattr(typ, "__name__") else str(typ)
     value_type = type(value)
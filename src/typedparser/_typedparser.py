@@ -1,13 +1,23 @@
 import argparse
+import sys
+from collections import OrderedDict
+from copy import copy
 from dataclasses import dataclass
-from typing import Optional, Any, Type
+from functools import lru_cache
+from typing import Optional, Any, Type, Hashable
 
 from attr import field, define
 
+from ._fastparser import compile_fast_parser
 from ._typedattr import AttrsClass
 from .custom_format import CustomArgparseFmt
 from .funcs import parse_typed_args, add_typed_args
 
+# templates built by TypedParser.from_parser, keyed by the user-provided cache_key
+# bounded the same way as the lru_cache of create_parser
+_from_parser_templates: "OrderedDict[Any, TypedParser]" = OrderedDict()
+_FROM_PARSER_TEMPLATES_MAXSIZE = 256
+
 
 @dataclass
 class TypedParser:
@@ -17,23 +27,88 @@ class TypedParser:
 
     def __post_init__(self):
         add_typed_args(self.parser, self.typed_args_class)
+        # specialized parse function, only set for parsers created by create_parser
+        self._fast_parse = None
+        # actions of the parser the fast parse function was created for
+        self._fast_parse_actions = []
 
     @classmethod
     def create_parser(
             cls, typed_args_class: AttrsClass, strict: bool = True,
             description: Optional[str] = None,
             formatter_class: Type = CustomArgparseFmt, **kwargs):
+        """
+        Create a new argparse parser for the typed args class.
+
+        The parser is built once per set of inputs and cached, calls with the same inputs
+        return a copy of the cached parser.
+        """
+        try:
+            kwargs_key = tuple(sorted(kwargs.items()))
+            hash(kwargs_key)
+        except TypeError:
+            # unhashable parser arguments, build without the cache
+            return cls._build_parser(
+                typed_args_class, strict, description, formatter_class, **kwargs)
+        return _build_parser_template(
+            cls, typed_args_class, strict, description, formatter_class, kwargs_key).copy()
+
+    @classmethod
+    def _build_parser(cls, typed_args_class: AttrsClass, strict: bool,
+                      description: Optional[str], formatter_class: Type, **kwargs):
         parser = argparse.ArgumentParser(
             description=description, formatter_class=formatter_class, **kwargs)
-        return cls(parser, typed_args_class, strict=strict)
+        typed_parser = cls(parser, typed_args_class, strict=strict)
+        # pylint: disable=protected-access
+        typed_parser._fast_parse = compile_fast_parser(parser)
+        typed_parser._fast_parse_actions = list(parser._actions)
+        return typed_parser
 
     @classmethod
     def from_parser(cls, parser: argparse.ArgumentParser, typed_args_class: Any,
-                    strict: bool = False):
-        return cls(parser, typed_args_class, strict=strict)
+                    strict: bool = False, cache_key: Optional[Hashable] = None):
+        """
+        Add the typed arguments to an existing argparse parser.
+
+        Args:
+            parser: the argparser
+            typed_args_class: a class decorated with @attrs.define where the arguments are stored
+                as fields with typedparser.add_argument().
+            strict: if True, typechecker will raise errors
+            cache_key: if given, the result is cached under this key together with the class
+                and strict setting. The input parser is not modified, the cached template is
+                built on a copy of it. Later calls with the same key return a copy of the cached
+                parser and ignore the input parser.
+        """
+        if cache_key is None:
+            return cls(parser, typed_args_class, strict=strict)
+        full_key = (cache_key, cls, typed_args_class, strict)
+        template = _from_parser_templates.get(full_key)
+        if template is None:
+            # build on a clone, later changes to the input parser must not reach the cache
+            template = cls(_clone_parser(parser), typed_args_class, strict=strict)
+            _from_parser_templates[full_key] = template
+            if len(_from_parser_templates) > _FROM_PARSER_TEMPLATES_MAXSIZE:
+                _from_parser_templates.popitem(last=False)
+        else:
+            _from_parser_templates.move_to_end(full_key)
+        # the cached template must not be modified by the caller, return a copy
+        return template.copy()
+
+    def copy(self) -> "TypedParser":
+        """Copy the typed parser. The argparse parser is cloned, see _clone_parser."""
+        new_typed_parser = copy(self)
+        new_typed_parser.parser = _clone_parser(self.parser)
+        # pylint: disable=protected-access
+        if self._fast_parse is not None and self.parser._actions == self._fast_parse_actions:
+            new_typed_parser._fast_parse_actions = list(new_typed_parser.parser._actions)
+        else:
+            new_typed_parser._fast_parse = None
+        return new_typed_parser
 
     def parse_args(self, args=None, namespace=None):
-        args = self.parser.parse_args(args, namespace)
+        fast_args = self._try_fast_parse(args, namespace)
+        args = self.parser.parse_args(args, namespace) if fast_args is None else fast_args
         typed_args = self._convert_args_to_typed_args(args)
         return typed_args
 
@@ -42,11 +117,84 @@ class TypedParser:
         typed_args = self._convert_args_to_typed_args(args)
         return typed_args, unknown_args
 
+    def _try_fast_parse(self, args, namespace) -> Optional[argparse.Namespace]:
+        # pylint: disable=protected-access
+        if (self._fast_parse is None or namespace is not None
+                # the parser was changed after creation
+                or self.parser._actions != self._fast_parse_actions
+                or self.parser._defaults):
+            return None
+        args = sys.argv[1:] if args is None else list(args)
+        args_dict = self._fast_parse(args)
+        if args_dict is None:
+            return None
+        return argparse.Namespace(**args_dict)
+
     def _convert_args_to_typed_args(self, args):
         typed_args = parse_typed_args(args, self.typed_args_class, strict=self.strict)
         return typed_args
 
 
+def _clone_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """
+    Clone an argparse parser much faster than deepcopy.
+
+    Copies the parser, its actions, argument groups and mutually exclusive groups, so that adding
+    arguments to the clone does not change the original. Everything else, e.g. the sub-parsers of
+    a subparsers action or the type and default objects of actions, is shared with the original.
+    """
+    # pylint: disable=protected-access
+    new_parser = copy(parser)
+    action_map = {}
+    for action in parser._actions:
+        new_action = copy(action)
+        new_action.option_strings = list(action.option_strings)
+        action_map[action] = new_action
+    new_parser._actions = list(action_map.values())
+    new_parser._option_string_actions = {
+        k: action_map[v] for k, v in parser._option_string_actions.items()}
+    new_parser._registries = {k: dict(v) for k, v in parser._registries.items()}
+    new_parser._defaults = dict(parser._defaults)
+    new_parser._has_negative_number_optionals = list(parser._has_negative_number_optionals)
+    new_parser._mutually_exclusive_groups = []
+
+    def _clone_group(group, container=None):
+        new_group = copy(group)
+        new_group._group_actions = [action_map[action] for action in group._group_actions]
+        for shared_attr in ("_registries", "_actions", "_option_string_actions", "_defaults",
+                            "_has_negative_number_optionals", "_mutually_exclusive_groups"):
+            setattr(new_group, shared_attr, getattr(new_parser, shared_attr))
+        if container is not None:
+            new_group._container = container
+        return new_group
+
+    group_map = {group: _clone_group(group) for group in parser._action_groups}
+    new_parser._action_groups = list(group_map.values())
+    new_parser._positionals = group_map.get(parser._positionals, parser._positionals)
+    new_parser._optionals = group_map.get(parser._optionals, parser._optionals)
+    container_map = {parser: new_parser, **group_map}
+    for mutex_group in parser._mutually_exclusive_groups:
+        container = group_map.get(mutex_group._container, new_parser)
+        new_mutex_group = _clone_group(mutex_group, container)
+        new_parser._mutually_exclusive_groups.append(new_mutex_group)
+        container_map[mutex_group] = new_mutex_group
+
+    # actions know their container, e.g. conflict_handler="resolve" removes them from it
+    for action, new_action in action_map.items():
+        old_container = getattr(action, "container", None)
+        if old_container in container_map:
+            new_action.container = container_map[old_container]
+    return new_parser
+
+
+@lru_cache(maxsize=256)
+def _build_parser_template(
+        typed_parser_class: Type[TypedParser], typed_args_class: AttrsClass, strict: bool,
+        description: Optional[str], formatter_class: Type, kwargs_key: tuple) -> TypedParser:
+    return typed_parser_class._build_parser(  # pylint: disable=protected-access
+        typed_args_class, strict, description, formatter_class, **dict(kwargs_key))
+
+
 def add_argument(*name_or_flags: str, shortcut: Optional[str] = None, **kwargs):
     """
     Interface matches ArgumentParser.add_argument:
@@ -66,6 +214,13 @@ def add_argument(*name_or_flags: str, shortcut: Optional[str] = None, **kwargs):
             f"Shortcut {shortcut} must start with '-'")
         assert not shortcut.startswith("--"), (
             f"Shortcut {shortcut} must not start with '--'")
+    # option strings are compared often during parsing, interned strings compare faster
+    name_or_flags = tuple(sys.intern(name) for name in name_or_flags)
+    if shortcut is not None:
+        shortcut = sys.intern(shortcut)
+    if kwargs.get("dest") is not None:
+        kwargs["dest"] = sys.intern(kwargs["dest"])
+
     # determine the default value
     default = kwargs.get("default")
     action = kwargs.get("action")
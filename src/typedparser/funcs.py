@@ -1,10 +1,13 @@
 import argparse
-from typing import Any, Dict
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Tuple, NamedTuple, FrozenSet, Optional
 
 from attr import AttrsInstance
-from attrs import has, fields_dict
+from attrs import has, fields_dict, fields, NOTHING, Factory
 
-from ._typedattr import attrs_from_dict
+from ._typedattr import (
+    attrs_from_dict, get_init_name, is_passthrough_type, get_strict_validator, ValueCheck)
 from .objects import get_attr_names
 
 
@@ -48,9 +51,9 @@ def add_typed_args(parser: argparse.ArgumentParser, typed_args_class) -> None:
             name_or_flags = []
             if shortcut is not None:
                 name_or_flags.append(shortcut)
-            name_or_flags.append(f"--{field_name}")
+            name_or_flags.append(sys.intern(f"--{field_name}"))
         try:
-            parser.add_argument(*name_or_flags, **field_metadata)
+            action = parser.add_argument(*name_or_flags, **field_metadata)
         except TypeError as e:
             raise TypeError(
                 f"Error adding argument {field_name} to parser, maybe passed keyword argument "
@@ -61,6 +64,57 @@ def add_typed_args(parser: argparse.ArgumentParser, typed_args_class) -> None:
                 f"In case of conflicting option strings, make sure to not create a TypedParser "
                 f"twice with the same argparser ArgumentParser. "
                 f"Original error was {type(e).__name__}: {e}") from e
+        # dest is the key of the value in the parsed namespace
+        action.dest = sys.intern(action.dest)
+
+
+class _FieldPlan(NamedTuple):
+    """Field information of an args class, stored as one tuple per property."""
+    names: Tuple[str, ...]
+    types: Tuple[Any, ...]
+    has_defaults: Tuple[bool, ...]
+    defaults: Tuple[Any, ...]
+    has_factories: Tuple[bool, ...]
+    names_set: FrozenSet[str]
+    init_names: Tuple[str, ...]
+    # if True, non-strict parsing does not change any values and can be skipped
+    is_nonstrict_passthrough: bool
+    # functions that check whether strict parsing returns the value unchanged
+    # None if any of the field types is not supported
+    validators: Optional[Tuple[ValueCheck, ...]]
+
+
+@lru_cache(maxsize=256)
+def _field_plan(typed_args_class) -> _FieldPlan:
+    """
+    Precompute the field information of the args class.
+    Factory defaults are not stored in has_defaults since they cannot be used as values directly,
+    the __init__ of the class has to create them.
+    """
+    atts = fields(typed_args_class)
+    return _FieldPlan(
+        names=tuple(att.name for att in atts),
+        types=tuple(att.type for att in atts),
+        has_defaults=tuple(
+            att.default is not NOTHING and not isinstance(att.default, Factory) for att in atts),
+        defaults=tuple(att.default for att in atts),
+        has_factories=tuple(isinstance(att.default, Factory) for att in atts),
+        names_set=frozenset(att.name for att in atts),
+        init_names=tuple(get_init_name(att) for att in atts),
+        is_nonstrict_passthrough=all(
+            att.init and is_passthrough_type(att.type) for att in atts),
+        validators=_get_validators(atts))
+
+
+def _get_validators(atts) -> Optional[Tuple[ValueCheck, ...]]:
+    # converters run before the typecheck in attrs_from_dict, so values cannot be checked up front
+    # fields with a default other than None are filled by argparse and are usually not None
+    validators = tuple(
+        get_strict_validator(att.type, maybe_none=att.default is NOTHING or att.default is None)
+        if att.init and att.converter is None else None for att in atts)
+    if any(validator is None for validator in validators):
+        return None
+    return validators
 
 
 def parse_typed_args(args: argparse.Namespace, typed_args_class, strict: bool = True
@@ -77,35 +131,72 @@ def parse_typed_args(args: argparse.Namespace, typed_args_class, strict: bool =
     Returns:
         instance of typed_args_class with the fields set by the input arguments
     """
-    args_dict = vars(args)
-    fields_keys = list(fields_dict(typed_args_class).keys())
+    parse_fn = _parse_strict if strict else _parse_nonstrict
+    return parse_fn(vars(args), typed_args_class)
 
-    missing_args = set(args_dict.keys()) - set(fields_keys)
-
-    # in strict mode, argparse output and defined arguments class must match
-    if len(missing_args) > 0:
-        args_desc = {k: args_dict[k] for k in sorted(missing_args)}
-        missing_err = (f"Argument(s) {args_desc} missing from configuration "
-                       f"'{typed_args_class.__name__}' with keys {fields_keys}.")
-        if strict:
-            raise KeyError(missing_err)
 
+def _get_field_values(args_dict: Dict[str, Any], plan: _FieldPlan) -> Dict[str, Any]:
     # retrieve the values from argparse output and create the typed instance
-    # arguments are allowed to be missing e.g. when using subparsers
-    all_keys = sorted(set(args_dict.keys()) | set(fields_keys))
-    kwargs = {f: args_dict.get(f) for f in all_keys}
-    out_args = attrs_from_dict(typed_args_class, kwargs, strict=strict)
+    # arguments are allowed to be missing e.g. when using subparsers, then the field default
+    # is used if it exists. fields with factory defaults are left out so __init__ creates them.
+    names, has_defaults, defaults = plan.names, plan.has_defaults, plan.defaults
+    has_factories = plan.has_factories
+    return {names[i]: args_dict.get(names[i], defaults[i]) if has_defaults[i]
+            else args_dict.get(names[i]) for i in range(len(names))
+            if not has_factories[i] or names[i] in args_dict}
+
+
+def _get_missing_err(args_dict: Dict[str, Any], typed_args_class, plan: _FieldPlan,
+                     missing_args) -> str:
+    args_desc = {k: args_dict[k] for k in sorted(missing_args)}
+    fields_keys = list(plan.names)
+    return (f"Argument(s) {args_desc} missing from configuration "
+            f"'{typed_args_class.__name__}' with keys {fields_keys}.")
 
+
+def _create_instance(typed_args_class, plan: _FieldPlan, values: Dict[str, Any]
+                     ) -> AttrsInstance:
+    return typed_args_class(**{
+        init_name: values[name] for name, init_name in zip(plan.names, plan.init_names)
+        if name in values})
+
+
+def _parse_strict(args_dict: Dict[str, Any], typed_args_class) -> AttrsInstance:
+    plan = _field_plan(typed_args_class)
+    # in strict mode, argparse output and defined arguments class must match
+    missing_args = args_dict.keys() - plan.names_set
     if len(missing_args) > 0:
-        # in non-strict mode try to add the missing arguments to the output
-        try:
-            for k in missing_args:
-                setattr(out_args, k, args_dict[k])
-        except AttributeError as e:
-            raise AttributeError(
-                f"Arguments are missing from configuration and cannot be added. "
-                f"Either add it to the configuration or decorate with @attrs.define(slots=False) "
-                f"to allow adding unknown fields. Missing: {missing_err}") from e  # noqa
+        raise KeyError(_get_missing_err(args_dict, typed_args_class, plan, missing_args))
+    values = _get_field_values(args_dict, plan)
+    # values created by factories are only known after __init__, typecheck them in attrs_from_dict
+    if plan.validators is not None and len(values) == len(plan.names) and all(
+            valid(values[name]) for name, valid in zip(plan.names, plan.validators)):
+        # all values have the correct type already, create the instance directly
+        return _create_instance(typed_args_class, plan, values)
+    # convert values or raise the typecheck error
+    return attrs_from_dict(typed_args_class, values, strict=True)
+
+
+def _parse_nonstrict(args_dict: Dict[str, Any], typed_args_class) -> AttrsInstance:
+    plan = _field_plan(typed_args_class)
+    if plan.is_nonstrict_passthrough:
+        # no conversions needed, create the instance directly
+        out_args = _create_instance(typed_args_class, plan, _get_field_values(args_dict, plan))
+    else:
+        out_args = attrs_from_dict(
+            typed_args_class, _get_field_values(args_dict, plan), strict=False)
+
+    # in non-strict mode try to add the missing arguments to the output
+    missing_args = args_dict.keys() - plan.names_set
+    try:
+        for k in missing_args:
+            setattr(out_args, k, args_dict[k])
+    except AttributeError as e:
+        missing_err = _get_missing_err(args_dict, typed_args_class, plan, missing_args)
+        raise AttributeError(
+            f"Arguments are missing from configuration and cannot be added. "
+            f"Either add it to the configuration or decorate with @attrs.define(slots=False) "
+            f"to allow adding unknown fields. Missing: {missing_err}") from e
     return out_args
 
 
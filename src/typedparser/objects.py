@@ -4,8 +4,8 @@ Generic utilities for python objects
 from abc import ABCMeta, abstractmethod
 from collections.abc import Mapping, Iterable
 from copy import deepcopy
-from functools import partial
-from typing import Any, Callable, Type, List
+from functools import partial, lru_cache
+from typing import Any, Callable, Type, List, Tuple
 
 import numpy as np
 from attr import has, AttrsInstance
@@ -16,7 +16,13 @@ AttrsClass = Type[AttrsInstance]
 
 def get_attr_names(cls: AttrsClass) -> List[str]:
     """Get all attribute names of an attrs class."""
-    return [att.name for att in fields(cls)]  # noqa
+    return list(_get_attr_names_cached(cls))
+
+
+@lru_cache(maxsize=256)
+def _get_attr_names_cached(cls: AttrsClass) -> Tuple[str, ...]:
+    # the fields of an attrs class do not change after creation
+    return tuple(att.name for att in fields(cls))  # noqa
 
 
 def get_all_base_classes(klass: type) -> List[type]:
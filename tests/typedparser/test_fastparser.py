@@ -0,0 +1,142 @@
+import argparse
+from copy import copy
+from typing import List, Optional
+
+import pytest
+from attrs import define
+
+from typedparser import add_argument, TypedParser
+from typedparser._fastparser import compile_fast_parser
+
+
+@define
+class arg_config:
+    str_arg: str = add_argument(default=f"some_value", type=str, help="String argument")
+    opt_str_arg: Optional[str] = add_argument(default=None, type=str, help="Optional argument")
+    bool_arg: bool = add_argument(shortcut="-b", action="store_true")
+    pos_arg: int = add_argument("pos_arg", type=int, help="Positional argument")
+    multi_pos_arg: List[str] = add_argument("multi_pos_arg", type=str, nargs="+")
+    int_arg: int = add_argument(shortcut="-i", type=int, default="3")
+    count_arg: Optional[int] = add_argument(shortcut="-c", action="count")
+    const_arg: Optional[int] = add_argument(action="store_const", const=42)
+    append_arg: Optional[List[str]] = add_argument(action="append")
+    append_const_arg: Optional[List[str]] = add_argument(action="append_const", const="a")
+    nargs_arg: Optional[List[str]] = add_argument(nargs="+")
+    dest_arg: str = add_argument("--foo", dest="dest_arg", default="b")
+
+
+@pytest.mark.parametrize("args_input, is_fast", (
+        (["1", "a"], True),
+        (["1", "a", "b", "--str_arg", "x", "-b"], True),
+        (["--str_arg", "x", "-b", "1", "a", "b"], True),
+        (["-i", "7", "-c", "-c", "--const_arg", "1", "a"], True),
+        (["--append_arg", "x", "--append_arg", "y", "--append_const_arg", "1", "a"], True),
+        (["--nargs_arg", "x", "y", "--foo", "z", "1", "a"], True),
+        (["1", "a", "--nargs_arg", "x", "y"], True),
+        (["1", "a", "--nargs_arg", "x", "-"], True),
+        (["--str_arg", "-", "1", "-"], True),
+        (["1", "-", "-"], True),
+        # the following cases are handled by argparse
+        (["1", "-b", "a", "b"], False),
+        (["--str_arg=x", "1", "a"], False),
+        (["-cc", "1", "a"], False),
+        (["--str", "x", "1", "a"], False),
+        (["-i", "-5", "1", "a"], False),
+        (["1", "a", "--", "b"], False),
+))
+def test_fast_parser(args_input, is_fast):
+    parser = TypedParser.create_parser(arg_config, strict=True).parser
+    fast_parse = compile_fast_parser(parser)
+    assert fast_parse is not None
+    fast_output = fast_parse(args_input)
+    assert (fast_output is not None) == is_fast
+    if is_fast:
+        assert fast_output == vars(parser.parse_args(args_input))
+
+
+@pytest.mark.parametrize("args_input", (
+        [], ["1"], ["x", "a"], ["-i", "x", "1", "a"], ["--str_arg"], ["1", "a", "--unknown"],
+        ["-h"],
+))
+def test_fast_parser_falls_back_on_errors(args_input):
+    parser = TypedParser.create_parser(arg_config, strict=True).parser
+    assert compile_fast_parser(parser)(args_input) is None
+
+
+@define
+class arg_config_nargs:
+    files: List[str] = add_argument(nargs="+")
+    out: str = add_argument("out")
+
+
+@pytest.mark.parametrize("args_input, is_fast", (
+        (["b", "--files", "a", "-"], True),
+        (["b", "--files", "-"], True),
+        # argparse fails since all values are consumed by --files and "out" is missing
+        (["--files", "a", "-"], False),
+        (["--files", "a", "-", "b"], False),
+))
+def test_fast_parser_dash(args_input, is_fast):
+    parser = TypedParser.create_parser(arg_config_nargs, strict=True).parser
+    fast_output = compile_fast_parser(parser)(args_input)
+    assert (fast_output is not None) == is_fast
+    if is_fast:
+        assert fast_output == vars(parser.parse_args(args_input))
+    else:
+        with pytest.raises(SystemExit):
+            parser.parse_args(args_input)
+
+
+def test_fast_parser_unsupported():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--foo", choices=["a", "b"])
+    assert compile_fast_parser(parser) is None
+
+    parser = argparse.ArgumentParser()
+    parser.add_subparsers().add_parser("a")
+    assert compile_fast_parser(parser) is None
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--foo", type=argparse.FileType("r"))
+    assert compile_fast_parser(parser) is None
+
+    for default in (("a",), "a"):
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--foo", action="append", default=default)
+        assert compile_fast_parser(parser) is None
+
+
+def test_fast_parser_append_list_default():
+    parser = argparse.ArgumentParser()
+    default = ["a"]
+    parser.add_argument("--foo", action="append", default=default)
+    fast_output = compile_fast_parser(parser)(["--foo", "b"])
+    assert fast_output == vars(parser.parse_args(["--foo", "b"])) == {"foo": ["a", "b"]}
+    assert default == ["a"]
+
+
+def test_fast_parser_not_used_after_parser_change():
+    @define(slots=False)
+    class arg_config_without_slots:
+        foo: str = add_argument(default="a")
+
+
+    t_parser = TypedParser.create_parser(arg_config_without_slots, strict=False)
+    t_parser.parser.add_argument("--extra", default="e")
+    args = t_parser.parse_args(["--foo", "b"])
+    assert args.foo == "b"
+    assert args.extra == "e"
+
+
+def test_fast_parser_not_used_after_action_replaced():
+    @define
+    class arg_config_replaced:
+        foo: str = add_argument(default="a")
+
+
+    t_parser = TypedParser.create_parser(arg_config_replaced)
+    # same number of actions as before, but a different action for --foo
+    new_action = copy(t_parser.parser._actions[-1])
+    new_action.default = "z"
+    t_parser.parser._actions[-1] = new_action
+    assert t_parser.parse_args([]).foo == "z"
@@ -34,6 +34,8 @@ Usage:
 
 """
 import logging
+import subprocess
+import sys
 from ast import parse, NodeVisitor, ImportFrom
 from importlib import util as import_util, import_module
 from importlib.machinery import ModuleSpec
@@ -184,4 +186,30 @@ module_list = list(recurse_modules("typedparser", ignore_tests=True, packages_on
 @pytest.mark.parametrize("module", module_list)
 def test_imports_from_source(module: str) -> None:
     print(f"Importing: {module}")
+    module_spec = import_util.find_spec(module)
+    if module_spec is not None and not str(module_spec.origin).endswith(".py"):
+        # e.g. module compiled with TYPEDPARSER_CYTHON=1, there is no source to check
+        pytest.skip(f"Module {module} is not a python source file: {module_spec.origin}")
     apply_visitor(module=module, visitor=ImportFromSourceChecker(module))
+
+
+def test_lazy_package_exports() -> None:
+    import typedparser
+
+    for name in typedparser.__all__:
+        assert name in dir(typedparser)
+        assert getattr(typedparser, name) is not None
+    with pytest.raises(AttributeError):
+        getattr(typedparser, "not_an_export")
+
+
+def test_lazy_package_submodules() -> None:
+    import typedparser
+
+    # submodules are imported on attribute access if they were not imported yet
+    code = "import typedparser; print(typedparser.funcs.__name__)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True).stdout
+    assert output.strip() == "typedparser.funcs"
+    with pytest.raises(AttributeError):
+        getattr(typedparser, "not_a_submodule")
@@ -10,6 +10,7 @@ import pytest
 from attr import define
 
 from typedparser import definenumpy, attrs_from_dict
+from typedparser._typedattr import get_strict_validator
 from typedparser.objects import flatten_dict
 
 
@@ -312,6 +313,27 @@ def test_skip_unknowns():
         _out = attrs_from_dict(CfgSlotsTrue, ref, skip_unknowns=False, strict=False)
 
 
+@define
+class CfgPositionalAndPrivate:
+    first: int
+    second: str
+    _private: int = 0
+
+
+def test_positional_and_private_fields():
+    # input order does not need to match the order of the positional fields
+    out = attrs_from_dict(CfgPositionalAndPrivate, {"second": "b", "_private": 3, "first": 1})
+    assert attrs.asdict(out) == {"first": 1, "second": "b", "_private": 3}
+
+
+def test_union_order():
+    # equal unions with different order must be resolved in their own order
+    cfg_int_first = attrs.make_class("CfgIntFirst", {"x": attrs.field(type=Union[int, float])})
+    cfg_float_first = attrs.make_class("CfgFloatFirst", {"x": attrs.field(type=Union[float, int])})
+    assert isinstance(attrs_from_dict(cfg_int_first, {"x": 3}).x, int)
+    assert isinstance(attrs_from_dict(cfg_float_first, {"x": 3}).x, float)
+
+
 def test_numpy_comparison():
     @definenumpy
     class CfgNumpyLocal:
@@ -344,3 +366,40 @@ def test_readme_content():
 
     assert str(attrs_from_dict(CfgNested, {"sub_cfg": {"foo": 1, "bar": 2}})
                ) == "CfgNested(sub_cfg=Cfg(foo=1, bar=2))"
+
+
+@pytest.mark.parametrize("typ, value, is_unchanged", [
+    pytest.param(int, 1, True, id="int"),
+    pytest.param(int, "1", False, id="int_wrong"),
+    pytest.param(float, 1, False, id="float_converted"),
+    pytest.param(Optional[str], None, True, id="optional_none"),
+    pytest.param(Optional[List[str]], ["a"], True, id="optional_list"),
+    pytest.param(Optional[List[str]], None, True, id="optional_list_none"),
+    pytest.param(List[str], ("a",), False, id="list_from_tuple"),
+    pytest.param(Union[float, int], 3, False, id="union_converted"),
+    pytest.param(Union[int, float], 3, True, id="union"),
+    pytest.param(Any, object(), True, id="any"),
+])
+def test_strict_validator(typ, value, is_unchanged):
+    validator = get_strict_validator(typ)
+    assert validator(value) == is_unchanged
+    if is_unchanged:
+        parsed_value = attrs_from_dict(_make_single_field_class(typ), {"x": value}).x
+        assert type(parsed_value) == type(value)  # pylint: disable=unidiomatic-typecheck
+        assert parsed_value == value
+
+
+def _make_single_field_class(typ):
+    return attrs.make_class("Cfg", {"x": attrs.field(type=typ)})
+
+
+def test_strict_validator_not_none():
+    validator = get_strict_validator(Optional[str], maybe_none=False)
+    assert validator("a")
+    # the check fails, the value will be parsed by attrs_from_dict
+    assert not validator(None)
+
+
+@pytest.mark.parametrize("typ", [None, Dict[str, int], Tuple[int, int], "int", List])
+def test_strict_validator_unsupported(typ):
+    assert get_strict_validator(typ) is None
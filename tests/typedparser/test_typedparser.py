@@ -1,17 +1,18 @@
 import argparse
 from copy import deepcopy
+from pathlib import Path
 from typing import List, Optional
 
+import attrs
 import pytest
 from attrs import define
-from pytest_lazyfixture import lazy_fixture
 
 from typedparser import add_argument, TypedParser
+from typedparser._typedparser import _clone_parser
 from typedparser.funcs import parse_typed_args, check_args_for_pytest
 
 
-@pytest.fixture(scope="module", params=([False, None], [True, None]), ids=("nonstrict", "strict"))
-def setup_correct_args(request):
+def _setup_correct_args():
     @define
     class arg_config:
         str_arg: str = add_argument(default=f"some_value", type=str, help="String argument")
@@ -22,60 +23,56 @@ def setup_correct_args(request):
         default_arg: str = add_argument(default="defaultvalue", type=str, help="Default argument")
 
 
-    strict, expected_error = request.param
     inputs = ["--str_arg", "some_other_value", "-b", "1", "a", "b"]
     outputs = {"str_arg": "some_other_value", "opt_str_arg": None, "bool_arg": True, "pos_arg": 1,
                "multi_pos_arg": ["a", "b"], "default_arg": "defaultvalue", }
-    yield arg_config, inputs, outputs, strict, expected_error
+    return arg_config, inputs, outputs
 
 
-@pytest.fixture(scope="module", params=([False, None], [True, TypeError]),
-                ids=("nonstrict", "strict"))
-def setup_incorrect_args(request):
+def _setup_incorrect_args():
     @define
     class arg_config:
         # error: default None is not compatible with type str
         opt_str_arg: str = add_argument(default=None, type=str)
 
 
-    strict, expected_error = request.param
     inputs = []
     outputs = {"opt_str_arg": None, }
-    yield arg_config, inputs, outputs, strict, expected_error
+    return arg_config, inputs, outputs
 
 
-@pytest.fixture(scope="module", params=([False, None], [True, TypeError]),
-                ids=("nonstrict", "strict"))
-def setup_untyped_args(request):
+def _setup_untyped_args():
     @define
     class arg_config:
         opt_str_arg = add_argument(default="content", type=str)
 
 
-    strict, expected_error = request.param
     inputs = []
     outputs = {"opt_str_arg": "content"}
+    return arg_config, inputs, outputs
+
+
+_ARGS_SETUPS = {
+    "correct": _setup_correct_args,
+    "incorrect": _setup_incorrect_args,
+    "untyped": _setup_untyped_args,
+}
+
+
+@pytest.fixture(scope="module", params=[
+    pytest.param(["correct", False, None], id="correct-nonstrict"),
+    pytest.param(["correct", True, None], id="correct-strict"),
+    pytest.param(["incorrect", False, None], id="incorrect-nonstrict"),
+    pytest.param(["incorrect", True, TypeError], id="incorrect-strict"),
+    pytest.param(["untyped", False, None], id="untyped-nonstrict"),
+    pytest.param(["untyped", True, TypeError], id="untyped-strict"),
+])
+def setup_all_args(request):
+    setup_name, strict, expected_error = request.param
+    arg_config, inputs, outputs = _ARGS_SETUPS[setup_name]()
     yield arg_config, inputs, outputs, strict, expected_error
 
 
-@pytest.fixture(scope="module", params=([False, None], [True, TypeError]),
-                ids=("nonstrict", "strict"))
-def setup_partially_typed_args(request):
-    @define
-    class arg_config:
-        untyped_arg = add_argument(default=None, type=str)
-        typed_arg: str = add_argument(default=None, type=str)
-
-
-    strict, expected_error = request.param
-    inputs = []
-    outputs = {"opt_str_arg": None, }
-    yield arg_config, inputs, outputs, strict, expected_error
-
-
-@pytest.mark.parametrize(
-    "setup_all_args", [lazy_fixture("setup_correct_args"), lazy_fixture("setup_incorrect_args"),
-                       lazy_fixture("setup_untyped_args")])
 def test_typedparser(setup_all_args):
     """Tests parsing of arguments with TypedParser"""
     config_class, inputs, outputs, strict, expected_error = setup_all_args
@@ -103,49 +100,57 @@ def get_typecheck_args():
     return args
 
 
-@pytest.fixture(scope="module", params=([False, None], [True, None]), ids=("nonstrict", "strict"))
-def setup_correct_typecheck(request):
+def _setup_correct_typecheck():
     @define
     class arg_config:
         foo: bool = None
         bar: bool = None
 
 
-    strict, expected_error = request.param
-    yield arg_config, get_typecheck_args(), {"foo": True, "bar": True}, strict, expected_error
+    return arg_config
 
 
-@pytest.fixture(scope="module", params=([False, AttributeError], [True, KeyError]),
-                ids=("nonstrict", "strict"))
-def setup_incorrect_typecheck(request):
+def _setup_incorrect_typecheck():
     @define
     class arg_config:
         foo: bool = None
         # error: missing type annotation for 'bar', crashes both strict False and True
 
 
-    strict, expected_error = request.param
-    yield arg_config, get_typecheck_args(), {"foo": True, "bar": True}, strict, expected_error
+    return arg_config
 
 
-@pytest.fixture(scope="module", params=([False, None], [True, KeyError]),
-                ids=("nonstrict", "strict"))
-def setup_incorrect_typecheck_without_slots(request):
+def _setup_incorrect_typecheck_without_slots():
     @define(slots=False)
     class arg_config:
         foo: bool = None
         # error: missing type annotation for 'bar', slots is False so works with strict False
 
 
-    strict, expected_error = request.param
+    return arg_config
+
+
+_TYPECHECK_SETUPS = {
+    "correct": _setup_correct_typecheck,
+    "incorrect": _setup_incorrect_typecheck,
+    "incorrect_without_slots": _setup_incorrect_typecheck_without_slots,
+}
+
+
+@pytest.fixture(scope="module", params=[
+    pytest.param(["correct", False, None], id="correct-nonstrict"),
+    pytest.param(["correct", True, None], id="correct-strict"),
+    pytest.param(["incorrect", False, AttributeError], id="incorrect-nonstrict"),
+    pytest.param(["incorrect", True, KeyError], id="incorrect-strict"),
+    pytest.param(["incorrect_without_slots", False, None], id="incorrect_without_slots-nonstrict"),
+    pytest.param(["incorrect_without_slots", True, KeyError], id="incorrect_without_slots-strict"),
+])
+def setup_all_typechecks(request):
+    setup_name, strict, expected_error = request.param
+    arg_config = _TYPECHECK_SETUPS[setup_name]()
     yield arg_config, get_typecheck_args(), {"foo": True, "bar": True}, strict, expected_error
 
 
-@pytest.mark.parametrize(
-    "setup_all_typechecks",
-    [lazy_fixture("setup_correct_typecheck"),
-     lazy_fixture("setup_incorrect_typecheck"),
-     lazy_fixture("setup_incorrect_typecheck_without_slots")])
 def test_typecheck(setup_all_typechecks):
     """Tests only typechecking of argparse output"""
     print(f"********** {setup_all_typechecks} **********")
@@ -301,3 +306,122 @@ def test_subparser(args_input, gt_dict):
 
     args = TypedParser.from_parser(parser, arg_config, strict=True).parse_args(args_input)
     check_args_for_pytest(args, gt_dict)
+
+
+def test_create_parser_cache():
+    @define
+    class arg_config:
+        foo: str = add_argument(shortcut="-f", default="a")
+
+
+    parser1 = TypedParser.create_parser(arg_config, strict=True)
+    parser2 = TypedParser.create_parser(arg_config, strict=True)
+    assert parser1 is not parser2
+    assert parser1.parser is not parser2.parser
+    check_args_for_pytest(parser1.parse_args(["-f", "b"]), {"foo": "b"})
+    check_args_for_pytest(parser2.parse_args([]), {"foo": "a"})
+    # modifying a returned parser must not change the cached template
+    parser1.parser.add_argument("--bar")
+    check_args_for_pytest(
+        TypedParser.create_parser(arg_config, strict=True).parse_args([]), {"foo": "a"})
+
+
+def test_from_parser_cache_key():
+    @define
+    class arg_config:
+        foo: bool = add_argument(action="store_true")
+
+
+    base_parser = argparse.ArgumentParser()
+    parser1 = TypedParser.from_parser(base_parser, arg_config, cache_key="key")
+    # changes to the input parser must not change the cached template
+    base_parser.add_argument("--leak", default="L")
+    parser2 = TypedParser.from_parser(argparse.ArgumentParser(), arg_config, cache_key="key")
+    assert parser1.parser is not parser2.parser
+    assert vars(parser2.parser.parse_args(["--foo"])) == {"foo": True}
+    check_args_for_pytest(parser2.parse_args(["--foo"]), {"foo": True})
+
+
+def test_parse_typed_args_uses_field_default():
+    @define
+    class arg_config:
+        foo: bool = None
+        baz: str = "default"
+
+
+    typed_args = parse_typed_args(argparse.Namespace(foo=True), arg_config, strict=True)
+    check_args_for_pytest(typed_args, {"foo": True, "baz": "default"})
+
+
+@pytest.mark.parametrize("strict", (False, True), ids=("nonstrict", "strict"))
+def test_parse_typed_args_uses_field_factory(strict):
+    @define
+    class arg_config:
+        foo: int = 3
+        bar: List[str] = attrs.Factory(list)
+
+
+    typed_args = parse_typed_args(argparse.Namespace(), arg_config, strict=strict)
+    check_args_for_pytest(typed_args, {"foo": 3, "bar": []})
+    typed_args = parse_typed_args(argparse.Namespace(bar=["a"]), arg_config, strict=strict)
+    check_args_for_pytest(typed_args, {"foo": 3, "bar": ["a"]})
+
+
+def test_clone_parser():
+    parser = argparse.ArgumentParser(prog="PROG")
+    parser.add_argument("pos", type=int)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--foo', action='store_true')
+    group.add_argument('--bar', action='store_false')
+    arg_group = parser.add_argument_group("group")
+    arg_group.add_argument("--baz", default="z")
+
+    new_parser = _clone_parser(parser)
+    assert new_parser.format_help() == parser.format_help()
+    assert vars(new_parser.parse_args(["1", "--foo"])) == vars(parser.parse_args(["1", "--foo"]))
+    with pytest.raises(SystemExit):
+        new_parser.parse_args(["1", "--foo", "--bar"])
+
+    # changes to the clone must not change the original
+    new_parser.add_argument("--new")
+    arg_group.add_argument("--other")
+    assert "--new" not in parser.format_help()
+    assert "--other" not in new_parser.format_help()
+
+    # conflict_handler="resolve" removes the replaced action from its container in the clone
+    parser = argparse.ArgumentParser(conflict_handler="resolve")
+    parser.add_argument("--foo", default="a")
+    parser.add_mutually_exclusive_group().add_argument("--bar", default="b")
+    new_parser = _clone_parser(parser)
+    new_parser.add_argument("--foo", default="z")
+    new_parser.add_argument("--bar", default="y")
+    assert vars(new_parser.parse_args([])) == {"foo": "z", "bar": "y"}
+    assert vars(parser.parse_args([])) == {"foo": "a", "bar": "b"}
+
+
+def test_clone_parser_conflict_resolve():
+    @define
+    class arg_config:
+        foo: str = add_argument(default="a")
+
+
+    t_parser = TypedParser.create_parser(arg_config, conflict_handler="resolve")
+    t_parser.parser.add_argument("--foo", default="z")
+    check_args_for_pytest(t_parser.parse_args([]), {"foo": "z"})
+    # the cached template is not changed
+    check_args_for_pytest(TypedParser.create_parser(
+        arg_config, conflict_handler="resolve").parse_args([]), {"foo": "a"})
+
+
+@pytest.mark.parametrize("strict", (False, True), ids=("nonstrict", "strict"))
+def test_conversions(strict):
+    @define
+    class arg_config:
+        path_arg: Path = add_argument(type=str, default="a/b")
+        float_arg: float = add_argument(type=int, default=1)
+        int_arg: Optional[int] = add_argument(type=int)
+
+
+    args = TypedParser.create_parser(arg_config, strict=strict).parse_args(["--int_arg", "3"])
+    check_args_for_pytest(args, {"path_arg": Path("a/b"), "float_arg": 1., "int_arg": 3})
+    assert isinstance(args.float_arg, float)